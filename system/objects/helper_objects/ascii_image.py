@@ -1,4 +1,6 @@
 import copy
+import os
+import sys
 import time
 
 from system.objects.helper_objects.coordinate_objects import coordinate as coord, axis
@@ -355,29 +357,32 @@ def _assemble_image_frames(file_contents: list[str], metadata: dict[str, int | s
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    image_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "assets", "images",
+                              "flashing_logo.AAI")
+
+    start_time = time.perf_counter()
     # Create an image object.
-    img = Image(coord.Coordinate(), "C:\\Users\\dafan\\OneDrive\\Desktop\\CS\\Side Project Games and Apps\\Terminal System Attempt 2\\system\\assets\\images\\flashing_logo.AAI")
+    img = Image(coord.Coordinate(), image_path)
 
-    print(f"Time to create image: {time.time() - start_time}")
-    # Update the image.
-    img.update_animation()
+    print(f"Time to create image: {time.perf_counter() - start_time}")
 
-    # Print the image to the terminal.
-    print(img.grid)
+    # Render every frame once up front, so the loop below only pays for writing to the terminal.
+    start_time = time.perf_counter()
+    frames: list[bytes] = []
 
-    time.sleep(1)
+    for frame in img.frames:
+        img.grid = frame
+        frames.append((cursor.pos_code() + "\033[2J" + img.to_string() + "\n").encode("utf-8"))
 
-    # Update the image.
-    img.update_animation()
+    print(f"Time to render {len(frames)} frames: {time.perf_counter() - start_time}")
 
-    # Print the image to the terminal.
-    print(img.grid)
+    time.sleep(1)
+
+    frame_num = 0
 
     while True:
-        cursor.set_pos()
-        cursor.clear_screen()
-        img.update_animation()
-        print(img)
-        # print("\n----------\n")
-        time.sleep(.02)
+        sys.stdout.buffer.write(frames[frame_num])
+        sys.stdout.flush()
+
+        frame_num = (frame_num + 1) % len(frames)
+        time.sleep(img.frame_delay)
@@ -52,7 +52,8 @@ class Text(PixelGrid):
         """
         self._size = new_size
 
-        self._grid = [[self._default_pixel for _ in range(new_size.x_char)] for _ in range(new_size.y_char)]
+        self._grid = self._new_grid(new_size)
+        self.mark_all_dirty()
 
         self.should_draw = True
 
@@ -70,6 +71,7 @@ class Text(PixelGrid):
         for row in self._grid:
             for pix in row:
                 pix.themes = copy.deepcopy(self._overall_themes)
+        self.mark_all_dirty()
 
         self.should_draw = True
 
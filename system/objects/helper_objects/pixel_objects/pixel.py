@@ -12,6 +12,8 @@ class Pixel:
             The character of the pixel.
         themes (ThemeDict):
             The colors of the pixel.
+        style_str (str):
+            The escape codes of the pixel's current theme, without the character.
         printable_str (str):
             The printable string of the pixel.
 
@@ -21,6 +23,9 @@ class Pixel:
         change_theme(theme: ThemeTypes) -> None:
             Change the theme of the pixel.
     """
+
+    __slots__ = ('_char', '_themes', '_style_str', '_printable_str')
+
     def __init__(self, char: str = " ", themes: ThemeDict = ThemeDict()) -> None:
         """Initialize the pixel.
 
@@ -35,13 +40,15 @@ class Pixel:
         self._char = char
         self._themes = themes
 
-        self._printable_str = f"{self._themes}{self._char}{Colors.END}"
+        # The style and printable strings are built lazily and cached until the pixel changes.
+        self._style_str: str | None = None
+        self._printable_str: str | None = None
 
     def __str__(self):
-        return self._printable_str
+        return self.printable_str
 
     def __repr__(self):
-        return self._printable_str
+        return self.printable_str
 
     @property
     def char(self) -> str:
@@ -51,19 +58,28 @@ class Pixel:
     def themes(self) -> ThemeDict:
         return self._themes
 
+    @property
+    def style_str(self) -> str:
+        if self._style_str is None:
+            self._style_str = str(self._themes)
+        return self._style_str
+
     @property
     def printable_str(self) -> str:
+        if self._printable_str is None:
+            self._printable_str = f"{self.style_str}{self._char}{Colors.END}"
         return self._printable_str
 
     @char.setter
     def char(self, new_char: str) -> None:
         self._char = new_char
-        self._printable_str = f"{self._themes}{new_char}{Colors.END}"
+        self._printable_str = None
 
     @themes.setter
     def themes(self, new_theme: ThemeDict | None) -> None:
         self._themes = new_theme if new_theme else ThemeDict()
-        self._printable_str = f"{self._themes}{self._char}{Colors.END}"
+        self._style_str = None
+        self._printable_str = None
 
     def set(self, other: 'Pixel') -> None:
         """Set the pixel to have the values of another pixel.
@@ -75,7 +91,9 @@ class Pixel:
         self._char = other.char
         self._themes = other.themes
 
-        self._printable_str = f"{self._themes}{self._char}{Colors.END}"
+        # Share the other pixel's cached strings since the two are now identical.
+        self._style_str = other._style_str
+        self._printable_str = other._printable_str
 
     def change_theme(self, theme: ThemeTypes) -> None:
         """Change the theme of the pixel.
@@ -85,13 +103,14 @@ class Pixel:
                 The theme to change to.
         """
         self._themes.current_theme_type = theme
-        self._printable_str = f"{self._themes}{self._char}{Colors.END}"
+        self._style_str = None
+        self._printable_str = None
 
     def __call__(self, *args, **kwargs):
-        return f"{self._themes}{self._char}{Colors.END}"
+        return self.printable_str
 
     def __eq__(self, other: 'Pixel') -> bool:
-        return self._printable_str == other._printable_str
+        return self.printable_str == other.printable_str
 
     def __ne__(self, other: 'Pixel') -> bool:
         return not self == other
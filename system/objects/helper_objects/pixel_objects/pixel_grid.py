@@ -1,10 +1,12 @@
 import copy
+import itertools
 
 import system.objects.helper_objects.pixel_objects.pixel as pixel
 import system.objects.helper_objects.coordinate_objects.coordinate as coord
 import system.objects.helper_objects.pixel_objects.pixel_theme as theme
 from system.objects.helper_objects.coordinate_objects.axis import Axis, UnitNames
 from system.objects.helper_objects.coordinate_objects.point import Point
+from system.utilities.color import Colors
 
 
 class PixelGrid:
@@ -19,6 +21,8 @@ class PixelGrid:
             The default pixel of the PixelGrid.
         grid (list[list[Pixel]]):
             The grid of the PixelGrid.
+        dirty_area (tuple[int, int, int, int] | None):
+            The (left, top, right, bottom) area changed since the dirty area was last cleared, or None if nothing has.
 
     Methods:
         clear() -> None:
@@ -29,8 +33,16 @@ class PixelGrid:
             Overlay the other PixelGrid onto this PixelGrid based on the other's coordinates.
         to_string() -> str:
             Return the printable string representation of the PixelGrid.
+        same_pixels(other: PixelGrid) -> bool:
+            Return whether the PixelGrids have the same pixels.
         change_pixel(new_pixel: Pixel, coordinates: Coordinate) -> None:
             Change the pixel at the given coordinates.
+        mark_dirty(left: int, top: int, right: int, bottom: int) -> None:
+            Expand the dirty area to include the given area.
+        mark_all_dirty() -> None:
+            Mark the whole PixelGrid as dirty.
+        clear_dirty() -> None:
+            Mark the PixelGrid as unchanged.
 
             Theme Methods:
 
@@ -63,6 +75,8 @@ class PixelGrid:
         - Add a method to blend the PixelGrid.
     """
 
+    __slots__ = ('_coordinates', '_size', '_default_pixel', '_overall_themes', '_grid', '_dirty_area')
+
     def __init__(self, coordinates: coord.Coordinate, size: coord.Coordinate,
                  default_pixel: pixel.Pixel = pixel.Pixel(),
                  overall_themes: theme.ThemeDict = theme.ThemeDict()) -> None:
@@ -85,14 +99,18 @@ class PixelGrid:
         self._default_pixel: pixel.Pixel = default_pixel
         self._overall_themes: theme.ThemeDict = overall_themes
 
-        # Create the grid of pixels.
-        self._grid: list[list[pixel.Pixel]] = [[default_pixel for _ in range(size.x_char)] for _ in range(size.y_char)]
+        # Create the grid of pixels. Each cell gets its own pixel so changing one doesn't change them all.
+        self._grid: list[list[pixel.Pixel]] = self._new_grid(size)
 
         # Set the themes of the pixels.
         for row in self._grid:
             for pix in row:
                 pix.themes = copy.deepcopy(self._overall_themes)
 
+        # The whole grid is new, so all of it needs drawing.
+        self._dirty_area: tuple[int, int, int, int] | None = None
+        self.mark_all_dirty()
+
     @property
     def coordinates(self) -> coord.Coordinate:
         """Return the coordinates of the PixelGrid.
@@ -133,6 +151,18 @@ class PixelGrid:
         """
         return self._grid
 
+    @property
+    def dirty_area(self) -> tuple[int, int, int, int] | None:
+        """Return the area of the PixelGrid that has changed since the dirty area was last cleared.
+
+        Returns:
+            tuple[int, int, int, int]:
+                The (left, top, right, bottom) of the changed area. The right and bottom are exclusive.
+            None:
+                If nothing has changed.
+        """
+        return self._dirty_area
+
     @property
     def screen_size(self) -> Point:
         """Return the screen size of the PixelGrid.
@@ -168,6 +198,8 @@ class PixelGrid:
             for pix in row:
                 pix.themes = copy.deepcopy(self._overall_themes)
 
+        self.mark_all_dirty()
+
     @screen_size.setter
     def screen_size(self, new_screen_size: Point) -> None:
         """Set the screen size of the PixelGrid.
@@ -199,7 +231,9 @@ class PixelGrid:
         """
         self._size = new_size
 
-        self._grid = [[self._default_pixel for _ in range(new_size.x_char)] for _ in range(new_size.y_char)]
+        self._grid = self._new_grid(new_size)
+
+        self.mark_all_dirty()
 
     @default_pixel.setter
     def default_pixel(self, new_default_pixel: pixel.Pixel) -> None:
@@ -229,6 +263,22 @@ class PixelGrid:
             Axis(y_char, UnitNames.CHAR, self._size.screen_size.y),
         )
 
+        self.mark_all_dirty()
+
+    def _new_grid(self, size: coord.Coordinate) -> list[list[pixel.Pixel]]:
+        """Return a new grid of separate copies of the default pixel, themes included.
+
+        Args:
+            size (Coordinate):
+                The size of the grid.
+
+        Returns:
+            list[list[Pixel]]: The new grid.
+        """
+        default_pixel = self._default_pixel
+
+        return [[copy.copy(default_pixel) for _ in range(size.x_char)] for _ in range(size.y_char)]
+
     def change_overall_theme(self, theme_name: theme.ThemeTypes) -> None:
         """Set the theme of all the pixels in the PixelGrid.
 
@@ -240,6 +290,8 @@ class PixelGrid:
             for pix in row:
                 pix.change_theme(theme_name)
 
+        self.mark_all_dirty()
+
     def update_overall_theme(self, themes: dict[theme.ThemeTypes, theme.PixelTheme] | theme.ThemeDict) -> None:
         """Update the values of the theme of all the pixels in the PixelGrid.
 
@@ -257,6 +309,8 @@ class PixelGrid:
             for pix in row:
                 pix.themes = copy.deepcopy(theme_dict)
 
+        self.mark_all_dirty()
+
     def change_theme(self, theme_name: theme.ThemeTypes, coordinates: coord.Coordinate) -> None:
         """Set the theme of the pixel at the given coordinates.
 
@@ -267,6 +321,7 @@ class PixelGrid:
                 The coordinates of the pixel to change the theme of.
         """
         self._grid[coordinates.y_char][coordinates.x_char].change_theme(theme_name)
+        self._mark_pixel_dirty(coordinates.x_char, coordinates.y_char)
 
     def update_theme(self, themes: dict[theme.ThemeTypes, theme.PixelTheme] | theme.ThemeDict,
                      coordinates: coord.Coordinate) -> None:
@@ -284,6 +339,7 @@ class PixelGrid:
             theme_dict = themes
 
         self._grid[coordinates.y_char][coordinates.x_char].themes = copy.deepcopy(theme_dict)
+        self._mark_pixel_dirty(coordinates.x_char, coordinates.y_char)
 
     def change_pixel(self, new_pixel: pixel.Pixel, coordinates: coord.Coordinate) -> None:
         """Change the pixel at the given coordinates.
@@ -295,6 +351,7 @@ class PixelGrid:
                 The coordinates of the pixel to change.
         """
         self._grid[coordinates.y_char][coordinates.x_char] = copy.deepcopy(new_pixel)
+        self._mark_pixel_dirty(coordinates.x_char, coordinates.y_char)
 
     def change_pixel_theme_area(self, theme_name: theme.ThemeTypes, start: coord.Coordinate,
                                 end: coord.Coordinate) -> None:
@@ -308,9 +365,10 @@ class PixelGrid:
             end (Coordinate):
                 The ending coordinates of the area.
         """
-        for y in range(start.y_char, end.y_char + 1):
-            for x in range(start.x_char, end.x_char + 1):
-                self._grid[y][x].change_theme(theme_name)
+        for pix in self._area(start, end):
+            pix.change_theme(theme_name)
+
+        self.mark_dirty(start.x_char, start.y_char, end.x_char + 1, end.y_char + 1)
 
     def update_pixel_theme_area(self, themes: dict[theme.ThemeTypes, theme.PixelTheme] | theme.ThemeDict,
                                 start: coord.Coordinate, end: coord.Coordinate) -> None:
@@ -331,15 +389,83 @@ class PixelGrid:
             theme_dict = themes
 
         # Update the theme of the pixels in the area.
-        for y in range(start.y_char, end.y_char + 1):
-            for x in range(start.x_char, end.x_char + 1):
-                self._grid[y][x].themes = copy.deepcopy(theme_dict)
+        for pix in self._area(start, end):
+            pix.themes = copy.deepcopy(theme_dict)
+
+        self.mark_dirty(start.x_char, start.y_char, end.x_char + 1, end.y_char + 1)
+
+    def _area(self, start: coord.Coordinate, end: coord.Coordinate) -> itertools.chain:
+        """Return an iterator over the pixels in the area, inclusive. Each row is sliced once rather than indexing the
+        grid twice for every pixel.
+
+        Args:
+            start (Coordinate):
+                The starting coordinates of the area.
+            end (Coordinate):
+                The ending coordinates of the area.
+
+        Returns:
+            itertools.chain: An iterator over the pixels in the area, row by row.
+        """
+        start_x, end_x = start.x_char, end.x_char + 1
+
+        return itertools.chain.from_iterable(row[start_x:end_x] for row in self._grid[start.y_char:end.y_char + 1])
+
+    def mark_dirty(self, left: int, top: int, right: int, bottom: int) -> None:
+        """Expand the dirty area to include the given area. Only needs calling directly after changing the pixels in
+        the grid without going through the PixelGrid's own methods.
+
+        Args:
+            left (int):
+                The left of the changed area.
+            top (int):
+                The top of the changed area.
+            right (int):
+                The right of the changed area, exclusive.
+            bottom (int):
+                The bottom of the changed area, exclusive.
+        """
+        # Keep the area within the grid.
+        left, top = max(left, 0), max(top, 0)
+        right, bottom = min(right, self._size.x_char), min(bottom, self._size.y_char)
+
+        if left >= right or top >= bottom:
+            return
+
+        if self._dirty_area is not None:
+            old_left, old_top, old_right, old_bottom = self._dirty_area
+            left, top = min(left, old_left), min(top, old_top)
+            right, bottom = max(right, old_right), max(bottom, old_bottom)
+
+        self._dirty_area = (left, top, right, bottom)
+
+    def _mark_pixel_dirty(self, x: int, y: int) -> None:
+        """Expand the dirty area to include a single pixel.
+
+        Args:
+            x (int):
+                The x coordinate of the pixel.
+            y (int):
+                The y coordinate of the pixel.
+        """
+        self.mark_dirty(x, y, x + 1, y + 1)
+
+    def mark_all_dirty(self) -> None:
+        """Mark the whole PixelGrid as dirty."""
+        self._dirty_area = None
+        self.mark_dirty(0, 0, self._size.x_char, self._size.y_char)
+
+    def clear_dirty(self) -> None:
+        """Mark the PixelGrid as unchanged. Should be called once the changes have been drawn."""
+        self._dirty_area = None
 
     def clear(self) -> None:
         """Clear the PixelGrid. Set all pixels to the default pixel."""
         for pix in self:
             pix.set(self._default_pixel)
 
+        self.mark_all_dirty()
+
     def fill(self, fill_pixel: pixel.Pixel) -> None:
         """Fill the PixelGrid with the given pixel.
 
@@ -350,6 +476,8 @@ class PixelGrid:
         for pix in self:
             pix.set(fill_pixel)
 
+        self.mark_all_dirty()
+
     def overlay(self, other: "PixelGrid") -> bool:
         """Overlay the other PixelGrid onto this PixelGrid based on the other's coordinates.
 
@@ -367,33 +495,80 @@ class PixelGrid:
         something_changed = False
 
         # Get the offset of the other PixelGrid.
-        offset = other._coordinates
+        offset_x = other._coordinates.x_char
+        offset_y = other._coordinates.y_char
+
+        # Clip the other PixelGrid to the bounds of this one once, rather than checking every pixel.
+        start_y, end_y = self._clip_range(offset_y, len(other._grid), self._size.y_char)
 
-        # Overlay the other PixelGrid onto this PixelGrid.
-        for y, row in enumerate(other._grid):
-            for x, pix in enumerate(row):
-                # Skip the pixel if it'd be out of bounds.
-                if y + offset.y_char < 0 or x + offset.x_char < 0:
-                    continue
-                if y + offset.y_char >= self._size.y_char or x + offset.x_char >= self._size.x_char:
-                    continue
+        # Overlay the other PixelGrid onto this PixelGrid one row slice at a time, keeping track of the widest row.
+        widest_end_x = 0
+        for y in range(start_y, end_y):
+            row = other._grid[y]
+            start_x, end_x = self._clip_range(offset_x, len(row), self._size.x_char)
 
-                # Check if the pixel is different.
-                # if str(self._grid[y + offset.y_char][x + offset.x_char]) != str(pix):
-                #     something_changed = True
+            if start_x < end_x:
+                self._grid[y + offset_y][start_x + offset_x:end_x + offset_x] = row[start_x:end_x]
+                widest_end_x = max(widest_end_x, end_x)
 
-                # Overlay the pixel.
-                self._grid[y + offset.y_char][x + offset.x_char] = pix
+        self.mark_dirty(offset_x, start_y + offset_y, widest_end_x + offset_x, end_y + offset_y)
 
         return something_changed
 
+    @staticmethod
+    def _clip_range(offset: int, source_length: int, target_length: int) -> tuple[int, int]:
+        """Return the range of source indices that land inside the target when shifted by the offset.
+
+        Args:
+            offset (int):
+                The offset of the source within the target.
+            source_length (int):
+                The length of the source along the axis.
+            target_length (int):
+                The length of the target along the axis.
+
+        Returns:
+            tuple[int, int]: The start (inclusive) and end (exclusive) source indices. Empty if start >= end.
+        """
+        return max(0, -offset), min(source_length, target_length - offset)
+
+    def same_pixels(self, other: "PixelGrid") -> bool:
+        """Return whether the PixelGrids have the same pixels. Relies on list comparison so the rows are walked in C
+        and it stops at the first differing pixel.
+
+        Args:
+            other (PixelGrid):
+                The PixelGrid to compare to.
+
+        Returns:
+            bool: Whether the PixelGrids have the same pixels.
+        """
+        return self is other or self._grid == other._grid
+
     def to_string(self) -> str:
         """Return the printable string representation of the PixelGrid.
 
         Returns:
             str: The printablestring representation of the PixelGrid.
         """
-        return "\n".join(["".join([str(pix) for pix in row]) for row in self._grid])
+        return "\n".join([self._row_to_string(row) for row in self._grid])
+
+    @staticmethod
+    def _row_to_string(row: list[pixel.Pixel]) -> str:
+        """Return the printable string of a single row, emitting the escape codes once per run of identically styled
+        pixels instead of once per pixel.
+
+        Args:
+            row (list[Pixel]):
+                The row of pixels to convert.
+
+        Returns:
+            str: The printable string of the row.
+        """
+        return "".join([
+            f"{style}{''.join([pix.char for pix in run])}{Colors.END}"
+            for style, run in itertools.groupby(row, key=lambda pix: pix.style_str)
+        ])
 
     def __str__(self) -> str:
         """Return the string representation of the PixelGrid.
@@ -401,7 +576,7 @@ class PixelGrid:
         Returns:
             str: The string representation of the PixelGrid.
         """
-        return "\n".join(["".join([str(pix) for pix in row]) for row in self._grid])
+        return self.to_string()
 
     def __repr__(self) -> str:
         """Return the string representation of the PixelGrid.
@@ -419,15 +594,13 @@ class PixelGrid:
         """
         return len(self._grid)
 
-    def __iter__(self) -> pixel.Pixel:
+    def __iter__(self) -> itertools.chain:
         """Return the iterator of the PixelGrid.
 
         Returns:
-            Pixel: The iterator of the PixelGrid.
+            itertools.chain: The iterator over the pixels of the PixelGrid, row by row.
         """
-        for row in self._grid:
-            for pix in row:
-                yield pix
+        return itertools.chain.from_iterable(self._grid)
 
     def __contains__(self, item: pixel.Pixel) -> bool:
         """Return whether the PixelGrid contains the given pixel.
@@ -463,3 +636,4 @@ class PixelGrid:
                 The pixel to set.
         """
         self._grid[key.y_char][key.x_char] = value
+        self._mark_pixel_dirty(key.x_char, key.y_char)
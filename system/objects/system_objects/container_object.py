@@ -154,7 +154,7 @@ class ContainerObject(BaseObject):
         # Check if the grid has changed. We can't just check if any pixels changed as they are overlayed because adding
         # an object to the container will change the grid even if adding another later would put it back to how it was
         # before.
-        if self.grid != initial_grid:
+        if not self.grid.same_pixels(initial_grid):
             self.should_draw = True
 
     def update(self, input_handler: InputHandler) -> bool:
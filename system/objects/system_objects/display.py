@@ -4,10 +4,10 @@ from copy import deepcopy
 
 import system.utilities.cursor as cursor
 
+import system.objects.helper_objects.pixel_objects.pixel as pixel
 import system.objects.helper_objects.pixel_objects.pixel_grid as pixel_grid
 import system.objects.helper_objects.coordinate_objects.coordinate as coord
 import system.objects.helper_objects.coordinate_objects.axis as ax
-from system.objects.helper_objects.coordinate_objects.point import Point
 
 
 class Display:
@@ -51,48 +51,84 @@ class Display:
         print(self._display_string, end="", flush=True)
 
         self._previous_pixel_grid = deepcopy(self._display_pixel_grid)
+        self._display_pixel_grid.clear_dirty()
 
     def anti_flash_refresh_display(self) -> None:
         """Refresh the display with the most recent display string, only updating the parts that are different. Slower,
         but prevents flashing."""
-        # Skip if there have been no changes.
-        # if self._display_pixel_grid == self._previous_pixel_grid:
-        #     return
+        # If the previous display array has different dimensions to the current one, resize it to match and check
+        # everything. Only the parts that actually differ get redrawn, rather than reprinting the whole screen.
+        if self._grid_dimensions(self._previous_pixel_grid) != self._grid_dimensions(self._display_pixel_grid):
+            self._resize_previous_grid()
+            self._display_pixel_grid.mark_all_dirty()
 
-        # If the previous display array is a different size than the current one, clear the screen and print the whole
-        # thing. Usually should only occur when changing display sizes.
-        if self._previous_pixel_grid.size != self._display_pixel_grid.size:
-            self.refresh_display()
+        # Skip if there have been no changes.
+        dirty_area = self._display_pixel_grid.dirty_area
+        if dirty_area is None:
             return
 
         # if len(self._display_pixel_grid.grid) != len(self._previous_pixel_grid.grid):
         #     print("Display size mismatch.")
         #     return
 
-        # Cycle through the display array and print the characters that have changed.
-        for y, row in enumerate(self._display_pixel_grid.grid):
+        # Cycle through the changed area of the display array and collect the characters that have changed. Each run of
+        # changed pixels on a row is prefixed with a single cursor move so the whole frame can be written at once.
+        output_parts: list[str] = []
+        display_grid = self._display_pixel_grid.grid
+        previous_grid = self._previous_pixel_grid.grid
+        left, top, right, bottom = dirty_area
+
+        for y in range(top, bottom):
+            row = display_grid[y]
+            previous_row = previous_grid[y]
+            in_run = False
+
+            for x in range(left, right):
+                pix = row[x]
+                if pix != previous_row[x]:
+                    if not in_run:
+                        output_parts.append(cursor.pos_code(y, x))
+                        in_run = True
+                    output_parts.append(pix.printable_str)
+                else:
+                    in_run = False
+
+        # Finish by resetting the cursor to the top left and writing everything in one go.
+        output_parts.append(cursor.pos_code(0, 0))
+        sys.stdout.write("".join(output_parts))
+        sys.stdout.flush()
+
+        # Update the changed area of the previous display grid.
+        for y in range(top, bottom):
+            previous_grid[y][left:right] = deepcopy(display_grid[y][left:right])
+
+        self._display_pixel_grid.clear_dirty()
+
+    @staticmethod
+    def _grid_dimensions(grid: pixel_grid.PixelGrid) -> tuple[int, int]:
+        """Return the dimensions of a grid's pixels, ignoring the screen size its size is relative to.
 
-            string_buffer = ""
-            buffer_start: Point | None = None
+        Args:
+            grid (pixel_grid.PixelGrid):
+                The grid to measure.
 
-            for x, pixel in enumerate(row):
-                if pixel != self._previous_pixel_grid.grid[y][x]:
-                    if buffer_start is None:
-                        buffer_start = Point(x, y)
-                    string_buffer += pixel.printable_str
-                elif buffer_start is not None:
-                    cursor.set_pos(buffer_start.y, buffer_start.x)
-                    print(string_buffer, end="", flush=False)
+        Returns:
+            tuple[int, int]: The width and height of the grid in characters.
+        """
+        rows = grid.grid
+        return (len(rows[0]) if rows else 0), len(rows)
 
-                    string_buffer = ""
-                    buffer_start = None
+    def _resize_previous_grid(self) -> None:
+        """Resize the previous display grid to match the current one, keeping the pixels where the two overlap. Added
+        pixels are left empty so that they never match and always get drawn."""
+        previous_grid = self._previous_pixel_grid.grid
+        resized_grid = []
 
-        # Finish by resetting the cursor to the top left and flushing the print queue.
-        cursor.set_pos(0, 0)
-        print("", end="", flush=True)
+        for y, row in enumerate(self._display_pixel_grid.grid):
+            previous_row = previous_grid[y][:len(row)] if y < len(previous_grid) else []
+            resized_grid.append(previous_row + [pixel.Pixel("") for _ in range(len(row) - len(previous_row))])
 
-        # Update the previous display grid.
-        self._previous_pixel_grid = deepcopy(self._display_pixel_grid)
+        self._previous_pixel_grid.grid = resized_grid
 
     def update_display_grid(self, new_display_grid: pixel_grid.PixelGrid) -> None:
         """Update the display grid.
@@ -103,6 +139,11 @@ class Display:
         """
         # if new_display_grid != self._display_pixel_grid:
             # self._display_pixel_grid = deepcopy(new_display_grid)
+
+        # A different grid's dirty area says nothing about how it differs from what is on screen, so check all of it.
+        if new_display_grid is not self._display_pixel_grid:
+            new_display_grid.mark_all_dirty()
+
         self._display_pixel_grid = new_display_grid
         self.anti_flash_refresh_display()
 
@@ -161,6 +202,7 @@ class Display:
                 The new display array.
         """
         self._display_pixel_grid = deepcopy(new_display_array)
+        self._display_pixel_grid.mark_all_dirty()
         self.anti_flash_refresh_display()
 
     @display_string.setter
@@ -171,7 +213,7 @@ class Display:
             new_display_string (str):
                 The new display string.
         """
-        self._display_string = deepcopy(new_display_string)
+        self._display_string = new_display_string
         self.refresh_display()
 
     @display_size.setter
@@ -185,7 +227,7 @@ class Display:
         self._display_size = deepcopy(new_display_size)
         self._display_pixel_grid.size = self._display_size
 
-        self.refresh_display()
+        self.anti_flash_refresh_display()
 
 
 if __name__ == "__main__":
@@ -16,7 +16,7 @@ from system.objects.helper_objects.pixel_objects.pixel_grid import PixelGrid
 from system.objects.system_objects.display_manager import DisplayManager
 
 from system.utilities import cursor
-from system.utilities.color import Colors
+from system.utilities.color import Colors, enable_ansi
 
 
 class TerminalSystem:
@@ -53,6 +53,8 @@ class TerminalSystem:
         self._mouse_enabled = mouse_enabled
         self._in_editor = in_editor
 
+        enable_ansi()
+
         self.run: bool = True
         self._rate_limiter = RateLimiter(self.desired_fps)
 
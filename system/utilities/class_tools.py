@@ -19,6 +19,9 @@ class Toggle:
         state (bool):
             The current state of the Toggle.
     """
+
+    __slots__ = ('state', '_true_value', '_false_value')
+
     def __init__(self, state: bool = False, true_value: Any = True, false_value: Any = False) -> None:
         """Initialize the Toggle object.
 
@@ -34,57 +37,55 @@ class Toggle:
                 Defaults to False.
         """
         self.state: bool = state
-        self._value_options: dict[bool, Any] = {
-            True: true_value,
-            False: false_value
-        }
+        self._true_value: Any = true_value
+        self._false_value: Any = false_value
 
     @property
     def true_value(self) -> Any:
-        return self._value_options[True]
+        return self._true_value
 
     @true_value.setter
     def true_value(self, value: Any) -> None:
-        self._value_options[True] = value
+        self._true_value = value
 
     @property
     def false_value(self) -> Any:
-        return self._value_options[False]
+        return self._false_value
 
     @false_value.setter
     def false_value(self, value: Any) -> None:
-        self._value_options[False] = value
+        self._false_value = value
 
     def __call__(self) -> bool | Any:
         self.state = not self.state
-        return self._value_options[self.state]
+        return self._true_value if self.state else self._false_value
 
     def __bool__(self) -> bool | Any:
-        return self._value_options[self.state]
+        return self._true_value if self.state else self._false_value
 
     def __repr__(self) -> bool | Any:
-        return self._value_options[self.state]
+        return self._true_value if self.state else self._false_value
 
     def __str__(self) -> str:
-        return str(self._value_options[self.state])
+        return str(self._true_value if self.state else self._false_value)
 
     def __eq__(self, other: Any) -> bool:
-        return self._value_options[self.state] == other
+        return (self._true_value if self.state else self._false_value) == other
 
     def __ne__(self, other: Any) -> bool:
-        return self._value_options[self.state] != other
+        return (self._true_value if self.state else self._false_value) != other
 
     def __lt__(self, other: Any) -> bool:
-        return self._value_options[self.state] < other
+        return (self._true_value if self.state else self._false_value) < other
 
     def __le__(self, other: Any) -> bool:
-        return self._value_options[self.state] <= other
+        return (self._true_value if self.state else self._false_value) <= other
 
     def __gt__(self, other: Any) -> bool:
-        return self._value_options[self.state] > other
+        return (self._true_value if self.state else self._false_value) > other
 
     def __ge__(self, other: Any) -> bool:
-        return self._value_options[self.state] >= other
+        return (self._true_value if self.state else self._false_value) >= other
 
 
 class ArgumentativeFunction:
@@ -99,6 +100,8 @@ class ArgumentativeFunction:
             The keyword arguments to be passed to the function.
     """
 
+    __slots__ = ('function', 'args', 'kwargs')
+
     def __init__(self, function: Callable, *args, **kwargs) -> None:
         """Initialize the ArgumentativeFunction object.
 
@@ -115,6 +118,12 @@ class ArgumentativeFunction:
         self.kwargs = kwargs
 
     def __call__(self, *args, **kwargs) -> object:
+        # Only merge in the extra arguments when there are some, since stored callbacks are usually called bare.
+        if not args and not kwargs:
+            return self.function(*self.args, **self.kwargs)
+        if not kwargs:
+            return self.function(*(self.args + args), **self.kwargs)
+
         return self.function(*(self.args + args), **(self.kwargs | kwargs))
 
 
@@ -128,7 +137,8 @@ class Cycler:
         values (list[Any]):
             The values to cycle through.
         index (int):
-            The current index in the list.
+            The current index in the list. Always kept within the bounds of the values, so if the values are shortened
+            directly, the index should be updated as well.
 
     Methods:
         reverse():
@@ -137,6 +147,8 @@ class Cycler:
             Get the next value in the list. The step_size can be used to skip values or go backwards.
     """
 
+    __slots__ = ('values', 'index')
+
     def __init__(self, values: list[Any], start_index: int = 0) -> None:
         """Initialize the Cycler object.
 
@@ -148,56 +160,59 @@ class Cycler:
                 Defaults to 0.
         """
         self.values = values
-        self.index = start_index
+        # Keep the index within the bounds of the values so that reads never need to wrap it.
+        self.index = start_index % len(values) if values else 0
 
     def reverse(self) -> None:
-        """Reverse the order of the values."""
-        self.values = self.values[::-1]
+        """Reverse the order of the values in place, keeping the current value selected."""
+        self.values.reverse()
+        self.index = len(self.values) - 1 - self.index if self.values else 0
 
     def __call__(self, step_size: int = 1) -> Any:
-        self.index = (self.index + step_size) % len(self.values)
-        return self.values[self.index]
+        # Stepping forward by one is by far the most common case, so wrap with a comparison instead of a modulo.
+        if step_size == 1:
+            index = self.index + 1
+            if index >= len(self.values):
+                index = 0
+        else:
+            index = (self.index + step_size) % len(self.values)
+
+        self.index = index
+        return self.values[index]
 
     def __bool__(self) -> Any:
-        self.index = self.index % len(self.values)
         return self.values[self.index]
 
     def __repr__(self) -> Any:
-        self.index = self.index % len(self.values)
         return self.values[self.index]
 
     def __str__(self) -> str:
-        self.index = self.index % len(self.values)
         return str(self.values[self.index])
 
     def __eq__(self, other: Any) -> bool:
-        self.index = self.index % len(self.values)
         return self.values[self.index] == other
 
     def __ne__(self, other: Any) -> bool:
-        self.index = self.index % len(self.values)
         return self.values[self.index] != other
 
     def __lt__(self, other: Any) -> bool:
-        self.index = self.index % len(self.values)
         return self.values[self.index] < other
 
     def __le__(self, other: Any) -> bool:
-        self.index = self.index % len(self.values)
         return self.values[self.index] <= other
 
     def __gt__(self, other: Any) -> bool:
-        self.index = self.index % len(self.values)
         return self.values[self.index] > other
 
     def __ge__(self, other: Any) -> bool:
-        self.index = self.index % len(self.values)
         return self.values[self.index] >= other
 
 
 class RateLimiter:
     """A class that limits the rate at which a program runs by sleeping a dynamic amount of time when called."""
 
+    __slots__ = ('_fps', '_rate', 'last_call')
+
     def __init__(self, fps: float) -> None:
         """Initialize the RateLimiter object.
 
@@ -219,11 +234,17 @@ class RateLimiter:
         self._rate = 1.0 / value
 
     def __call__(self, *args, **kwargs) -> Any:
-        remaining_time = self._rate - (time.time() - self.last_call)
+        now = time.perf_counter()
+        next_deadline = self.last_call + self._rate
+        remaining_time = next_deadline - now
 
         if remaining_time > 0:
             time.sleep(remaining_time)
-            self.last_call = time.time()
+            # Step from the deadline rather than the wake-up time so oversleeping doesn't accumulate as drift.
+            self.last_call = next_deadline
+        else:
+            # Running behind, so start the next frame from now instead of trying to catch up on missed ones.
+            self.last_call = now
 
         return remaining_time
 
@@ -1,159 +1,152 @@
 """A mapping between colors and escape codes for use in the text function"""
-from enum import Enum
-from typing import NamedTuple
+import os
+import re
+import sys
+from enum import IntEnum
+from functools import lru_cache
+from typing import Iterable, TextIO
 
 import colorama
 
-colorama.init()
 
+# Windows console mode flag that makes the console interpret escape codes itself.
+_ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
 
-class ColorType(Enum):
-    FORE: str = 'foreground'
-    BACK: str = 'background'
-    STYLE: str = 'style'
-    OTHER: str = 'other'
 
+def enable_ansi() -> None:
+    """Make the terminal understand escape codes. Call this once at startup, before anything colored is printed.
 
-class Color:
+    Does nothing outside of Windows. On Windows 10 and later the console is switched into virtual terminal mode so it
+    handles escape codes natively. Older consoles fall back to colorama, which wraps stdout and stderr to translate
+    escape codes on every write.
+    """
+    if os.name != 'nt':
+        return
+
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_ulong()
+
+    if (kernel32.GetConsoleMode(handle, ctypes.byref(mode)) and
+            kernel32.SetConsoleMode(handle, mode.value | _ENABLE_VIRTUAL_TERMINAL_PROCESSING)):
+        return
+
+    colorama.init()
+
+
+class ColorType(IntEnum):
+    FORE: int = 0
+    BACK: int = 1
+    STYLE: int = 2
+    OTHER: int = 3
+
+
+class Color(str):
+    """An escape code string tagged with the type of modification it makes. Behaves exactly like the escape code string
+    it holds, so concatenation, comparison, hashing and so on all use the built-in str implementations.
+
+    Attributes:
+        color_type (ColorType):
+            The type of modification the escape code makes.
+    """
+
+    __slots__ = ('color_type', '_color', '_encoded')
 
-    def __init__(self, color: str, color_type: ColorType) -> None:
-        self.color = color
-        self.color_type = color_type
+    def __new__(cls, color: str, color_type: ColorType) -> 'Color':
+        # Keep an interned plain copy of the escape code so every color with the same code shares one string, and
+        # getting it back out never has to copy it.
+        plain_color = sys.intern(str(color))
 
-    def __str__(self) -> str:
-        return self.color
+        new_color = super().__new__(cls, plain_color)
+        new_color.color_type = color_type
+        new_color._color = plain_color
+        new_color._encoded = None
+        return new_color
 
-    def __repr__(self) -> str:
-        return self.color
+    @property
+    def color(self) -> str:
+        """Return the escape code as a plain, interned string."""
+        return self._color
 
-    def __add__(self, other: str) -> str:
-        return self.color + other
+    @property
+    def encoded(self) -> bytes:
+        """Return the escape code encoded as UTF-8. Encoded once, the first time it's needed."""
+        if self._encoded is None:
+            self._encoded = self._color.encode()
+        return self._encoded
 
-    def __radd__(self, other: str) -> str:
-        return other + self.color
+    def __reduce__(self) -> tuple[type, tuple[str, ColorType]]:
+        return type(self), (self._color, self.color_type)
 
-    def __mul__(self, other: int) -> str:
-        return self.color * other
+    def __copy__(self) -> 'Color':
+        # Colors are immutable, so a copy can be the same object.
+        return self
 
-    def __rmul__(self, other: int) -> str:
-        return other * self.color
+    def __deepcopy__(self, memo: dict) -> 'Color':
+        return self
 
-    def __iadd__(self, other: 'Color') -> str:
-        return self.color + other
 
-    def __imul__(self, other: int) -> str:
-        return self.color * other
+# Matches a 6 or 3 digit hex color string, with or without a leading hash.
+_HEX_COLOR_PATTERN = re.compile(
+    r'#?([0-9a-fA-F]{2})([0-9a-fA-F]{2})([0-9a-fA-F]{2})|#?([0-9a-fA-F])([0-9a-fA-F])([0-9a-fA-F])'
+)
 
-    def __len__(self) -> int:
-        return len(self.color)
 
-    def __getitem__(self, key: int) -> str:
-        return self.color[key]
+# Matches a single SGR escape code, capturing its parameters.
+_SGR_PATTERN = re.compile(r'\033\[([\d;]*)m')
 
-    def __contains__(self, item: str) -> bool:
-        return item in self.color
 
-    def __eq__(self, other: 'Color') -> bool:
-        return self.color == other
+# Every 0-255 color ID, built once up front since there are only 512 of them.
+_FOREGROUND_COLOR_IDS: tuple[Color, ...] = tuple(Color(f'\033[38;5;{code}m', ColorType.FORE) for code in range(256))
+_BACKGROUND_COLOR_IDS: tuple[Color, ...] = tuple(Color(f'\033[48;5;{code}m', ColorType.BACK) for code in range(256))
 
-    def __ne__(self, other: 'Color') -> bool:
-        return self.color != other
 
-    def __lt__(self, other: 'Color') -> bool:
-        return self.color < other.color
+# RGB colors are built on demand. Programs tend to reuse a small palette, so the built colors are cached and shared.
 
-    def __le__(self, other: 'Color') -> bool:
-        return self.color <= other.color
+@lru_cache(maxsize=1024)
+def _make_rgb_fg(red: int, green: int, blue: int) -> Color:
+    """Build the foreground color for an RGB value. Assumes the values have already been validated."""
+    return Color(f'\033[38;2;{red};{green};{blue}m', ColorType.FORE)
 
-    def __gt__(self, other: 'Color') -> bool:
-        return self.color > other.color
 
-    def __ge__(self, other: 'Color') -> bool:
-        return self.color >= other.color
+@lru_cache(maxsize=1024)
+def _make_rgb_bg(red: int, green: int, blue: int) -> Color:
+    """Build the background color for an RGB value. Assumes the values have already been validated."""
+    return Color(f'\033[48;2;{red};{green};{blue}m', ColorType.BACK)
 
-    def __hash__(self) -> int:
-        return hash(self.color)
 
-    def __bool__(self) -> bool:
-        return bool(self.color)
+@lru_cache(maxsize=256)
+def _combine(colors: tuple[tuple[str, ColorType | None], ...]) -> Color:
+    """Merge escape codes into one. Each code is paired with its color type, or None for a plain string, because a
+    Color and its plain string are equal and would otherwise share a cache entry."""
+    params = []
+    color_types = set()
 
-    def __format__(self, format_spec: str) -> str:
-        return self.color.__format__(format_spec)
+    for color, color_type in colors:
+        match = _SGR_PATTERN.fullmatch(color)
+        if match is None:
+            continue
 
-    def __iter__(self):
-        return iter(self.color)
+        params.append(match.group(1))
+        color_types.add(ColorType.OTHER if color_type is None else color_type)
 
-    def __reversed__(self):
-        return reversed(self.color)
+    # Nothing to merge. An empty escape code would reset every attribute, so return an empty color instead.
+    if not params:
+        return Color('', ColorType.OTHER)
+
+    color_type = color_types.pop() if len(color_types) == 1 else ColorType.OTHER
+
+    return Color('\033[' + ';'.join(params) + 'm', color_type)
 
 
 class Colors:
     """A mapping between colors and escape codes for use in coloring text.
 
-    Attributes:
-        BOLD (Color): Bold text.
-        FAINT (Color): Faint text.
-        ITALIC (Color): Italic text.
-        UNDERLINE (Color): Underlined text.
-        BLINKING (Color): Blinking text.
-        INVERSE (Color): Inverse text.
-        HIDDEN (Color): Hidden text.
-        STRIKETHROUGH (Color): Strikethrough text.
-
-        BLACK (Color): Black text.
-        RED (Color): Red text.
-        GREEN (Color): Green text.
-        YELLOW (Color): Yellow text.
-        BLUE (Color): Blue text.
-        PURPLE (Color): Purple text.
-        CYAN (Color): Cyan text.
-        WHITE (Color): White text.
-
-        BRIGHT_BLACK (Color): Bright black text.
-        BRIGHT_RED (Color): Bright red text.
-        BRIGHT_GREEN (Color): Bright green text.
-        BRIGHT_YELLOW (Color): Bright yellow text.
-        BRIGHT_BLUE (Color): Bright blue text.
-        BRIGHT_PURPLE (Color): Bright purple text.
-        BRIGHT_CYAN (Color): Bright cyan text.
-        BRIGHT_WHITE (Color): Bright white text.
-
-        DEFAULT_COLOR (Color): Default text color.
-
-        BACKGROUND_BLACK (Color): Black background.
-        BACKGROUND_RED (Color): Red background.
-        BACKGROUND_GREEN (Color): Green background.
-        BACKGROUND_YELLOW (Color): Yellow background.
-        BACKGROUND_BLUE (Color): Blue background.
-        BACKGROUND_PURPLE (Color): Purple background.
-        BACKGROUND_CYAN (Color): Cyan background.
-        BACKGROUND_WHITE (Color): White background.
-
-        BACKGROUND_BRIGHT_BLACK (Color): Bright black background.
-        BACKGROUND_BRIGHT_RED (Color): Bright red background.
-        BACKGROUND_BRIGHT_GREEN (Color): Bright green background.
-        BACKGROUND_BRIGHT_YELLOW (Color): Bright yellow background.
-        BACKGROUND_BRIGHT_BLUE (Color): Bright blue background.
-        BACKGROUND_BRIGHT_PURPLE (Color): Bright purple background.
-        BACKGROUND_BRIGHT_CYAN (Color): Bright cyan background.
-        BACKGROUND_BRIGHT_WHITE (Color): Bright white background.
-
-        BACKGROUND_DEFAULT_COLOR (Color): Default background color.
-
-        ERROR (Color): Error text color.
-
-        WARN (Color): Warning symbol.
-        BELL (Color): Play a bell sound.
-
-        END (Color): End coloring
-
-    Methods:
-        custom(cls, code: int, back: bool = False) -> str:
-            Give a text or background modification color code based off of a specific escape code.
-        rgb(cls, red: int = 0, green: int = 0, blue: int = 0, back: bool = False) -> str:
-            Give a text or background modification color code based off of a decimal RGB input.
-        rgb_hex(cls, red: str = 0, green: str = 0, blue: str = 0, back: bool = False) -> str:
-            Give a text or background modification color code based off of a hex RGB
+    The styles, text colors, background colors (prefixed with BACKGROUND_), and special codes such as ERROR, WARN,
+    BELL, and END are all Color class attributes, listed in the class body. The classmethods build the colors that
+    aren't predefined, such as color IDs and RGB colors.
 
     Notes:
         BLINKING, FAINT, and HIDDEN are not supported in all terminals, and even if they are supported, they may
@@ -263,11 +256,7 @@ class Colors:
         if code < 0 or code > 255:
             raise ValueError('Color code must be between 0 and 255.')
 
-        # Return the correct color code.
-        if back:
-            return Color(f'\033[48;5;{code}m', ColorType.BACK)
-        else:
-            return Color(f'\033[38;5;{code}m', ColorType.FORE)
+        return (_BACKGROUND_COLOR_IDS if back else _FOREGROUND_COLOR_IDS)[code]
 
     @classmethod
     def rgb(cls, red: int = 0, green: int = 0, blue: int = 0, back: bool = False) -> Color:
@@ -293,15 +282,100 @@ class Colors:
         Raises:
             ValueError: If any of the color values are not between 0 and 255.
         """
-        # Verify the color values are valid.
-        if red < 0 or red > 255 or green < 0 or green > 255 or blue < 0 or blue > 255:
+        # Verify the color values are valid. For ints, OR-ing them together is only in 0-255 if every value is.
+        mixed = red | green | blue
+        if mixed < 0 or mixed > 255:
             raise ValueError('Color values must be between 0 and 255.')
 
-        # Return the correct color code.
         if back:
-            return Color(f'\033[48;2;{red};{green};{blue}m', ColorType.BACK)
-        else:
-            return Color(f'\033[38;2;{red};{green};{blue}m', ColorType.FORE)
+            return _make_rgb_bg(red, green, blue)
+        return _make_rgb_fg(red, green, blue)
+
+    @classmethod
+    def rgb_fg(cls, red: int = 0, green: int = 0, blue: int = 0) -> Color:
+        """Give a text modification color code based off of a decimal RGB input. Skips the foreground/background check
+        made by rgb, for callers that always want the foreground.
+
+        Args:
+            red (int, optional):
+                Red value of the text (0-255).
+                Defaults to 0.
+            green (int, optional):
+                Green value of the text (0-255).
+                Defaults to 0.
+            blue (int, optional):
+                Blue value of the text (0-255).
+                Defaults to 0.
+
+        Returns:
+            Color: The modification escape code ready to be input to text.
+
+        Raises:
+            ValueError: If any of the color values are not between 0 and 255.
+        """
+        mixed = red | green | blue
+        if mixed < 0 or mixed > 255:
+            raise ValueError('Color values must be between 0 and 255.')
+
+        return _make_rgb_fg(red, green, blue)
+
+    @classmethod
+    def rgb_bg(cls, red: int = 0, green: int = 0, blue: int = 0) -> Color:
+        """Give a background modification color code based off of a decimal RGB input. Skips the foreground/background
+        check made by rgb, for callers that always want the background.
+
+        Args:
+            red (int, optional):
+                Red value of the background (0-255).
+                Defaults to 0.
+            green (int, optional):
+                Green value of the background (0-255).
+                Defaults to 0.
+            blue (int, optional):
+                Blue value of the background (0-255).
+                Defaults to 0.
+
+        Returns:
+            Color: The modification escape code ready to be input to text.
+
+        Raises:
+            ValueError: If any of the color values are not between 0 and 255.
+        """
+        mixed = red | green | blue
+        if mixed < 0 or mixed > 255:
+            raise ValueError('Color values must be between 0 and 255.')
+
+        return _make_rgb_bg(red, green, blue)
+
+    @classmethod
+    def rgb_bulk(cls, colors: Iterable[tuple[int, int, int]], back: bool = False) -> bytes:
+        """Give the encoded escape codes for many decimal RGB inputs at once, joined into a single block of bytes ready
+        to be written to a stream. Each distinct color is only built and encoded once, however often it appears.
+
+        Args:
+            colors (Iterable[tuple[int, int, int]]):
+                The red, green, and blue values (0-255) of each color, in order.
+            back (bool, optional):
+                If True gives the codes for modifying the background instead of the foreground.
+                Defaults to False.
+
+        Returns:
+            bytes: The escape codes, one after another.
+
+        Raises:
+            ValueError: If any of the color values are not between 0 and 255.
+        """
+        make_rgb = _make_rgb_bg if back else _make_rgb_fg
+        encoded_colors = []
+
+        for red, green, blue in colors:
+            mixed = red | green | blue
+            if mixed < 0 or mixed > 255:
+                raise ValueError('Color values must be between 0 and 255.')
+
+            encoded_colors.append(make_rgb(red, green, blue).encoded)
+
+        return b''.join(encoded_colors)
 
     @classmethod
     def rgb_hex(cls, red_hex: str = "00", green_hex: str = "00", blue_hex: str = "00", back: bool = False) -> Color:
@@ -335,6 +409,7 @@ class Colors:
         return cls.rgb(red, green, blue, back)
 
     @classmethod
+    @lru_cache(maxsize=512)
     def rgb_hex_string(cls, hex_string: str, back: bool = False) -> Color:
         """Give a text or background modification color code based off of a hex RGB input string.
 
@@ -351,17 +426,20 @@ class Colors:
         Raises:
             ValueError: If the hex string is not a valid hex color string.
         """
-        # Remove the hash if it is there.
-        if hex_string.startswith('#'):
-            hex_string = hex_string[1:]
-
-        # Check the length of the hex string.
-        if len(hex_string) == 6:
-            return cls.rgb_hex(hex_string[:2], hex_string[2:4], hex_string[4:], back)
-        elif len(hex_string) == 3:
-            return cls.rgb_hex(hex_string[0] * 2, hex_string[1] * 2, hex_string[2] * 2, back)
-        else:
-            raise ValueError('Hex string must be either 3 or 6 characters long.')
+        match = _HEX_COLOR_PATTERN.fullmatch(hex_string)
+
+        if match is None:
+            raise ValueError('Hex string must be either 3 or 6 hex characters long.')
+
+        red, green, blue, short_red, short_green, short_blue = match.groups()
+
+        # Two hex digits can't go past 255, so the values don't need validating again. A short digit is doubled, which
+        # is the same as multiplying its value by 17 (0x11).
+        make_rgb = _make_rgb_bg if back else _make_rgb_fg
+
+        if red is not None:
+            return make_rgb(int(red, 16), int(green, 16), int(blue, 16))
+        return make_rgb(int(short_red, 16) * 17, int(short_green, 16) * 17, int(short_blue, 16) * 17)
 
     @classmethod
     def color_from_code(cls, color_str: str, color_type: ColorType = ColorType.OTHER) -> Color:
@@ -381,6 +459,10 @@ class Colors:
         Raises:
             ValueError: If the color code is not a valid escape code.
         """
+        # Known colors resolve straight to the shared instance.
+        color = _COLOR_LOOKUP.get(color_str)
+        if color is not None:
+            return color
 
         # Check if the color is an escape code.
         if not color_str.startswith('\033['):
@@ -394,11 +476,74 @@ class Colors:
 
         return Color(color_str, color_type)
 
+    @classmethod
+    def combine(cls, *colors: Color | str) -> Color:
+        """Merge several escape codes into a single escape code, so the terminal only has to parse one sequence.
+
+        Args:
+            colors (Color | str):
+                The escape codes to merge, in order. Anything that isn't a formatting escape code, such as a bell or a
+                symbol, is left out.
+
+        Returns:
+            Color: The merged escape code. Its type is shared by all of the input colors, or ColorType.OTHER if they
+            differ. Empty if none of the colors are formatting escape codes.
+        """
+        return _combine(tuple((str(color), color.color_type if type(color) is Color else None) for color in colors))
+
+    @classmethod
+    def apply(cls, text: str, *colors: Color | str) -> str:
+        """Wrap the text in the given colors, followed by END. Builds the result in one go rather than adding the parts
+        together one at a time.
+
+        Args:
+            text (str):
+                The text to color.
+            colors (Color | str):
+                The colors to apply, in order.
+
+        Returns:
+            str: The colored text.
+        """
+        return ''.join((*colors, text, cls.END))
+
+    @classmethod
+    def write_bytes(cls, stream: TextIO, *parts: Color | str) -> None:
+        """Write colors and text to a stream as a single block of bytes, using each color's pre-encoded escape code
+        rather than encoding it again on every write. Falls back to a normal write if the stream has no byte buffer.
+
+        Args:
+            stream (TextIO):
+                The stream to write to, such as sys.stdout.
+            parts (Color | str):
+                The colors and text to write, in order.
+        """
+        buffer = getattr(stream, 'buffer', None)
+
+        if buffer is None:
+            stream.write(''.join(parts))
+            return
+
+        # Flush any text already written so it stays in order with the bytes.
+        stream.flush()
+        buffer.write(b''.join([part.encoded if type(part) is Color else part.encode() for part in parts]))
+        buffer.flush()
+
+
+# Every predefined color and color ID keyed by its escape code, built once along with the Colors class.
+_COLOR_LOOKUP: dict[str, Color] = {
+    color: color
+    for color in (*_FOREGROUND_COLOR_IDS, *_BACKGROUND_COLOR_IDS, *vars(Colors).values())
+    if isinstance(color, Color)
+}
+
 
 if __name__ == '__main__':
 
-    print(Colors.UNDERLINE + 'Hello, underline!' + Colors.END)
-    print(Colors.DOUBLE_UNDERLINE + 'Hello, double underline!' + Colors.END)
+    enable_ansi()
+
+    print(Colors.apply('Hello, underline!', Colors.UNDERLINE))
+    print(Colors.apply('Hello, double underline!', Colors.DOUBLE_UNDERLINE))
 
     # color_list: list[Color] = [
     #     Colors.BOLD,
@@ -430,8 +575,8 @@ if __name__ == '__main__':
     # print(Colors.HIDDEN + 'Hello, hidden!' + Colors.END)
     # print(Colors.STRIKETHROUGH + 'Hello, strikethrough!' + Colors.END)
     #
-    # print(Colors.BOLD + Colors.ITALIC + Colors.UNDERLINE + Colors.BLINKING + Colors.INVERSE +
-    #       Colors.STRIKETHROUGH + Colors.RED + 'Hello, all!' + Colors.END)
+    # print(Colors.apply('Hello, all!', Colors.combine(Colors.BOLD, Colors.ITALIC, Colors.UNDERLINE, Colors.BLINKING,
+    #                                                   Colors.INVERSE, Colors.STRIKETHROUGH, Colors.RED)))
     #
     # # Italic
     # print(Colors.ITALIC + 'Hello, italic!' + Colors.END)
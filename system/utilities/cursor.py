@@ -22,6 +22,7 @@
     load(): Load the previously saved cursor position. Position can be saved with save().
 
     set_pos(): Set the position of the cursor to specific coordinates.
+    pos_code(): Return the escape code that set_pos() prints, for batching into a larger write.
 """
 
 import time
@@ -162,7 +163,24 @@ def set_pos(line: int = 0, column: int = 0):
             The column or x-axis to set the position of the cursor to.
             Defaults to 0. (The left side of the screen)
     """
-    print(f"\033[{line};{column}H", end="")
+    print(pos_code(line, column), end="")
+
+
+def pos_code(line: int = 0, column: int = 0) -> str:
+    """Return the escape code to set the position of the cursor without printing it.
+
+    Args:
+        line (int, optional):
+            The line or y-axis to set the position of the cursor to.
+            Defaults to 0. (The top of the screen)
+        column (int, optional):
+            The column or x-axis to set the position of the cursor to.
+            Defaults to 0. (The left side of the screen)
+
+    Returns:
+        str: The escape code.
+    """
+    return f"\033[{line};{column}H"
 
 
 # Hide and show cursor
@@ -1,4 +1,9 @@
-from typing import Any
+import bisect
+import itertools
+from array import array
+from collections import deque
+from operator import itemgetter
+from typing import Any, Iterable, NamedTuple
 
 
 class Queue:
@@ -6,34 +11,45 @@ class Queue:
     the queue or to add a value to the queue if an argument is passed. Functionally identical to the Stack class but
     with a different order of processing.
 
+    Properties:
+        queue (deque[Any]):
+            The values in the queue, front first. This is the queue's own storage rather than a copy, so code that
+            works through a queue in a hot loop can keep a reference to it instead of going through the property each
+            time.
+
     Methods:
         add(value: Any) -> None:
             Add a value to the back of the queue.
+        put(value: Any) -> None:
+            Add a value to the back of the queue, like calling the queue with a value.
+        get() -> Any | None:
+            Remove and return the next value in the queue, like calling the queue with no arguments.
         pop(distance: int = 0) -> Any | None:
             Remove and return the next value in the queue.
         peek(distance: int = 0) -> Any | None:
             Return the next value in the queue without removing it.
     """
 
-    def __init__(self, values: list[Any] | None = None) -> None:
+    __slots__ = ('_queue',)
+
+    def __init__(self, values: Iterable[Any] | None = None) -> None:
         """Initialize the Queue object.
 
         Args:
-            values (list[Any] | None, optional):
+            values (Iterable[Any] | None, optional):
                 The values to add to the queue.
                 Defaults to [] if None.
         """
-        if values is None:
-            values = []
-        self._queue = values
+        # A deque rather than a list, so taking values off the front doesn't shift everything behind them.
+        self._queue: deque[Any] = deque(values or ())
 
     @property
-    def queue(self) -> list[Any]:
+    def queue(self) -> deque[Any]:
         return self._queue
 
     @queue.setter
-    def queue(self, values: list[Any]) -> None:
-        self._queue = values
+    def queue(self, values: Iterable[Any]) -> None:
+        self._queue = deque(values)
 
     @queue.deleter
     def queue(self) -> None:
@@ -48,6 +64,26 @@ class Queue:
         """
         self._queue.append(value)
 
+    def put(self, value: Any) -> None:
+        """Add a value to the back of the queue. The same as calling the queue with a value, without checking which of
+        the two uses of the call is wanted.
+
+        Args:
+            value (Any):
+                The value to add to the back of the queue.
+        """
+        self._queue.append(value)
+
+    def get(self) -> Any | None:
+        """Remove and return the next value in the queue. The same as calling the queue with no arguments, without
+        checking which of the two uses of the call is wanted.
+
+        Returns:
+            Any: The next value in the queue.
+            None: If the queue is empty.
+        """
+        return self._queue.popleft() if self._queue else None
+
     def insert(self, value: Any, distance: int = 0) -> None:
         """Insert a value into the queue at a specified distance from the front of the queue. (Or back if negative.)
 
@@ -67,11 +103,18 @@ class Queue:
             Any: The next value in the queue.
             None: If the queue is empty.
         """
+        # Popping the front is by far the most common case, so it skips the general bounds check.
+        if distance == 0:
+            return self._queue.popleft() if self._queue else None
+
         # If the distance is out of bounds, return None. This also catches the case where the queue is empty.
-        if distance >= len(self._queue) or abs(distance) > len(self._queue):
+        length = len(self._queue)
+        if not -length <= distance < length:
             return None
 
-        return self._queue.pop(distance) if self._queue else None
+        value = self._queue[distance]
+        del self._queue[distance]
+        return value
 
     def peek(self, distance: int = 0) -> Any | None:
         """Return the next value in the queue without removing it.
@@ -85,8 +128,12 @@ class Queue:
             Any: The next value in the queue.
             None: If the queue is empty or the distance is out of bounds.
         """
+        if distance == 0:
+            return self._queue[0] if self._queue else None
+
         # If the distance is out of bounds, return None. This also catches the case where the queue is empty.
-        if distance >= len(self._queue) or abs(distance) > len(self._queue):
+        length = len(self._queue)
+        if not -length <= distance < length:
             return None
 
         return self._queue[distance]
@@ -106,16 +153,27 @@ class Queue:
                 Defaults to False.
         """
         if quantity == -1:
-            self._queue = [item for item in self._queue if item != value]
+            self._queue = deque(item for item in self._queue if item != value)
             return
 
-        for _ in range(quantity):
+        if quantity == 1:
             index = self.index(value, reverse=reverse)
 
             if index is not None:
                 del self._queue[index]
+            return
+
+        # Drop the first matches in a single pass, rather than searching the queue again for each one.
+        kept = deque()
+        keep = kept.appendleft if reverse else kept.append
+
+        for item in reversed(self._queue) if reverse else self._queue:
+            if quantity > 0 and item == value:
+                quantity -= 1
             else:
-                return
+                keep(item)
+
+        self._queue = kept
 
     def remove_at(self, index: int) -> None:
         """Remove a value from the queue at a specified index.
@@ -143,17 +201,20 @@ class Queue:
             int: The index of the value. Indexing starts at the front of the queue unless reverse is True.
             None: If the value is not in the queue or the instance is out of bounds.
         """
-        # Find all instances of the value in the queue.
-        instances = [i for i, item in enumerate(self._queue) if item == value]
+        # A negative instance counts from the other end, which is the same as searching in the other direction.
+        if instance < 0:
+            instance = -instance - 1
+            reverse = not reverse
 
-        # Reverse the list of instances if reverse is True.
-        instances = instances[::-1] if reverse else instances
-
-        # If the instance of the value is not in the queue, return None.
-        if instance >= len(instances) or abs(instance) > len(instances):
-            return None
+        # Find the instances of the value in the queue, only looking as far as the requested instance. Searching from
+        # the back walks the queue backwards rather than copying it.
+        if reverse:
+            last = len(self._queue) - 1
+            instances = (last - i for i, item in enumerate(reversed(self._queue)) if item == value)
+        else:
+            instances = (i for i, item in enumerate(self._queue) if item == value)
 
-        return instances[instance]
+        return next(itertools.islice(instances, instance, None), None)
 
     def __repr__(self) -> str:
         return str(self._queue[0] if self._queue else None)
@@ -166,7 +227,7 @@ class Queue:
             self._queue.append(value)
             return None
 
-        return self._queue.pop(0) if self._queue else None
+        return self._queue.popleft() if self._queue else None
 
     def __len__(self) -> int:
         return len(self._queue)
@@ -192,9 +253,19 @@ class Stack:
     the stack or to add a value to the stack if an argument is passed. Functionally identical to the Queue class but
     with a different order of processing.
 
+    Properties:
+        stack (list[Any]):
+            The values in the stack, bottom first. This is the stack's own storage rather than a copy, so code that
+            works through a stack in a hot loop can keep a reference to it instead of going through the property each
+            time.
+
     Methods:
         add(value: Any) -> None:
             Add a value to the top of the stack.
+        put(value: Any) -> None:
+            Add a value to the top of the stack, like calling the stack with a value.
+        get() -> Any | None:
+            Remove and return the next value in the stack, like calling the stack with no arguments.
         pop() -> Any | None:
             Remove and return the next value in the stack.
         peek() -> Any | None:
@@ -209,6 +280,8 @@ class Stack:
             Return the first index of a value in the stack.
     """
 
+    __slots__ = ('_stack',)
+
     def __init__(self, values: list[Any] | None = None) -> None:
         """Initialize the Stack object.
 
@@ -242,6 +315,26 @@ class Stack:
         """
         self._stack.append(value)
 
+    def put(self, value: Any) -> None:
+        """Add a value to the top of the stack. The same as calling the stack with a value, without checking which of
+        the two uses of the call is wanted.
+
+        Args:
+            value (Any):
+                The value to add to the top of the stack.
+        """
+        self._stack.append(value)
+
+    def get(self) -> Any | None:
+        """Remove and return the next value in the stack. The same as calling the stack with no arguments, without
+        checking which of the two uses of the call is wanted.
+
+        Returns:
+            Any: The next value in the stack.
+            None: If the stack is empty.
+        """
+        return self._stack.pop() if self._stack else None
+
     def insert(self, value: Any, distance: int = 0) -> None:
         """Insert a value into the stack at a specified distance from the top of the stack. (Or bottom if negative.)
 
@@ -266,14 +359,19 @@ class Stack:
             Any: The next value in the stack.
             None: If the stack is empty.
         """
+        # Popping the top is by far the most common case, so it skips the general bounds check.
+        if distance == 0:
+            return self._stack.pop() if self._stack else None
+
         # If the distance is positive, pop from the top of the stack. If negative, flip it to pop from the bottom of
         # the stack.
         flipped_distance = -distance - 1
         # If the distance is out of bounds, return None. This also catches the case where the stack is empty.
-        if flipped_distance >= len(self._stack) or abs(flipped_distance) > len(self._stack):
+        length = len(self._stack)
+        if not -length <= flipped_distance < length:
             return None
 
-        return self._stack.pop(flipped_distance) if self._stack else None
+        return self._stack.pop(flipped_distance)
 
     def peek(self, distance: int = 0) -> Any | None:
         """Return the next value in the stack without removing it.
@@ -287,11 +385,15 @@ class Stack:
             Any: The next value in the stack.
             None: If the stack is empty or the distance is out of bounds.
         """
+        if distance == 0:
+            return self._stack[-1] if self._stack else None
+
         # If the distance is positive, peek from the top of the stack. If negative, flip it to peek from the bottom of
         # the stack.
         flipped_distance = -distance - 1
         # If the distance is out of bounds, return None. This also catches the case where the stack is empty.
-        if flipped_distance >= len(self._stack) or abs(flipped_distance) > len(self._stack):
+        length = len(self._stack)
+        if not -length <= flipped_distance < length:
             return None
 
         return self._stack[flipped_distance]
@@ -329,13 +431,16 @@ class Stack:
             int: The index of the value.
             None: If the value is not in the stack or the instance is out of bounds.
         """
-        instances = [i for i, item in enumerate(self._stack[::-1]) if item == value]
-
-        # If the instance of the value is not in the stack, return None.
-        if instance >= len(instances) or abs(instance) > len(instances):
-            return None
+        # Find the instances of the value in the stack, only looking as far as the requested instance. The stack is
+        # walked backwards to count from the top, or forwards for a negative instance, rather than copying it.
+        if instance >= 0:
+            instances = (i for i, item in enumerate(reversed(self._stack)) if item == value)
+        else:
+            last = len(self._stack) - 1
+            instances = (last - i for i, item in enumerate(self._stack) if item == value)
+            instance = -instance - 1
 
-        return instances[instance]
+        return next(itertools.islice(instances, instance, None), None)
 
     def __len__(self) -> int:
         return len(self._stack)
@@ -369,13 +474,74 @@ class Stack:
         return value in self._stack
 
 
+class NumericStack(Stack):
+    """A Stack of numbers, packed into an array.array rather than stored as separate Python objects. A large stack of
+    numbers takes a fraction of the memory and is kept in one contiguous block. Every value must fit the array's type
+    code, so None and other non-numbers can't be added.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, values: Iterable[int | float] | None = None, typecode: str = 'q') -> None:
+        """Initialize the NumericStack object.
+
+        Args:
+            values (Iterable[int | float] | None, optional):
+                The values to add to the stack.
+                Defaults to [] if None.
+            typecode (str, optional):
+                The array.array type code the values are stored as, such as 'q' for 64-bit ints or 'd' for floats.
+                Defaults to 'q'.
+        """
+        super().__init__(array(typecode, values or ()))
+
+    @property
+    def stack(self) -> array:
+        return self._stack
+
+    @stack.setter
+    def stack(self, values: Iterable[int | float]) -> None:
+        self._stack = array(self._stack.typecode, values)
+
+    @stack.deleter
+    def stack(self) -> None:
+        del self._stack[:]
+
+    def remove(self, value: int | float) -> None:
+        """Remove a value from the stack. Note that this will remove all instances of the value.
+
+        Args:
+            value (int | float):
+                The value to remove from the stack.
+        """
+        self._stack = array(self._stack.typecode, (item for item in self._stack if item != value))
+
+
+class PriorityQueueItem(NamedTuple):
+    """A value in a priority queue along with its priority.
+
+    Attributes:
+        value (Any):
+            The value.
+        priority (float):
+            The priority of the value.
+    """
+    value: Any
+    priority: float
+
+
 class PriorityQueue:
     """A simple class that creates a priority queue of values to be processed in order. Can be called to get the next
     value in the queue or to add a value to the queue if an argument and priority are passed. Similar to the Queue
     class, but with the ability to prioritize values. The value with the highest priority will be processed first.
+    Values with the same priority are processed in the order they were added.
+
+    The values are kept sorted as they are added, so popping or peeking never has to sort the whole queue. Indexes
+    count from the front of the queue, so index 0 is always the next value to be processed.
 
     Properties:
-        queue (list[dict[str, Any | float]]):
+        queue (list[PriorityQueueItem]):
+            A copy of the values and their priorities, from highest to lowest priority.
 
     Methods:
         add(value: Any, priority: float) -> None:
@@ -394,31 +560,85 @@ class PriorityQueue:
             Return the first index of a value in the priority queue.
     """
 
-    def __init__(self, values: list[dict[str, Any | float]] | None = None) -> None:
+    __slots__ = ('_values', '_priorities', '_value_counts')
+
+    def __init__(self, values: Iterable[tuple[Any, float]] | None = None) -> None:
         """Initialize the PriorityQueue object.
 
         Args:
-            values (list[dict[str, Any | float]] | None, optional):
-                The values to add to the priority queue.
+            values (Iterable[tuple[Any, float]] | None, optional):
+                The values to add to the priority queue, as (value, priority) pairs such as PriorityQueueItems.
                 Defaults to [] if None.
         """
-        if values is None:
-            values = []
+        # The values and their priorities are kept in two matching sequences, sorted in ascending order so the next
+        # value out is at the end and popping it doesn't shift anything. Positions count from the end, so index 0 is
+        # stored at -1. The priorities are stored as a packed array of doubles so the statistics read plain floats
+        # instead of Python objects scattered around memory.
+        self._values: list[Any] = []
+        self._priorities: array = array('d')
 
-        self._priority_queue: list[dict[str, Any | float]] = values
+        # How many times each hashable value is in the queue, so checking for a value doesn't have to search for it.
+        # Unhashable values aren't counted and are always searched for.
+        self._value_counts: dict[Any, int] = {}
+
+        if values is not None:
+            self.queue = values
 
     @property
-    def queue(self) -> list[dict[str, Any | float]]:
-        return self._priority_queue
+    def queue(self) -> list[PriorityQueueItem]:
+        return [PriorityQueueItem(value, priority)
+                for value, priority in zip(reversed(self._values), reversed(self._priorities))]
 
     @queue.setter
-    def queue(self, values: list[dict[str, Any | float]]) -> None:
-        self._priority_queue = values
-        self._sort_queue()
+    def queue(self, values: Iterable[tuple[Any, float]]) -> None:
+        # The sort is stable, so sorting the values back to front leaves values with the same priority in the order
+        # they were given, counting from the end. Values that are already in order, such as another priority queue's
+        # items, only take the sort a single pass to check.
+        items = sorted(((priority, value) for value, priority in reversed(list(values))), key=itemgetter(0))
+
+        self._priorities = array('d', map(itemgetter(0), items))
+        self._values = list(map(itemgetter(1), items))
+
+        self._value_counts = {}
+        for value in self._values:
+            self._count_value(value, 1)
 
     @queue.deleter
     def queue(self) -> None:
-        self._priority_queue.clear()
+        self.clear()
+
+    def _insert(self, value: Any, priority: float) -> None:
+        """Insert a value into its place in the queue, behind any values with the same priority. Since the queue is
+        stored back to front, that means in front of them in the underlying sequences.
+
+        Args:
+            value (Any):
+                The value to insert.
+            priority (float):
+                The priority of the value.
+        """
+        index = bisect.bisect_left(self._priorities, priority)
+        self._priorities.insert(index, priority)
+        self._values.insert(index, value)
+
+    def _count_value(self, value: Any, change: int) -> None:
+        """Change how many times a value is counted as being in the queue.
+
+        Args:
+            value (Any):
+                The value being added to or removed from the queue.
+            change (int):
+                The change in the number of times the value is in the queue.
+        """
+        try:
+            count = self._value_counts.get(value, 0) + change
+        except TypeError:
+            return
+
+        if count > 0:
+            self._value_counts[value] = count
+        else:
+            self._value_counts.pop(value, None)
 
     def add(self, value: Any, priority: float = 0) -> None:
         """Add a value to the queue with a specified priority.
@@ -430,8 +650,8 @@ class PriorityQueue:
                 The priority of the value.
                 Defaults to 0.
         """
-        item = {"value": value, "priority": priority}
-        self._priority_queue.append(item)
+        self._insert(value, priority)
+        self._count_value(value, 1)
 
     def pop(self) -> Any | None:
         """Remove and return the next value in the queue.
@@ -440,16 +660,13 @@ class PriorityQueue:
             Any: The next value in the queue.
             None: If the queue is empty.
         """
-        if not self._priority_queue:
+        if not self._values:
             return None
 
-        self._sort_queue()
-
-        return self._priority_queue.pop(0)["value"]
-
-    def _sort_queue(self) -> None:
-        """Sort the queue by priority."""
-        self._priority_queue.sort(key=lambda x: x["priority"], reverse=True)
+        self._priorities.pop()
+        value = self._values.pop()
+        self._count_value(value, -1)
+        return value
 
     def peek(self) -> Any | None:
         """Return the next value in the queue without removing it.
@@ -458,16 +675,16 @@ class PriorityQueue:
             Any: The next value in the queue.
             None: If the queue is empty.
         """
-        if not self._priority_queue:
+        if not self._values:
             return None
 
-        self._sort_queue()
-
-        return self._priority_queue[0]["value"]
+        return self._values[-1]
 
     def clear(self) -> None:
         """Clear the priority queue."""
-        self._priority_queue.clear()
+        self._values.clear()
+        del self._priorities[:]
+        self._value_counts.clear()
 
     def remove(self, value: Any, quantity: int = 1) -> None:
         """Remove a value from the priority queue.
@@ -479,17 +696,34 @@ class PriorityQueue:
                 The number of instances of the value to remove. Set to -1 to remove all instances.
                 Defaults to 1.
         """
-        if quantity == -1:
-            self._priority_queue = [item for item in self._priority_queue if item["value"] != value]
+        # Nothing to remove, so don't search or rebuild the queue.
+        if value not in self:
             return
 
-        for _ in range(quantity):
+        if quantity == 1:
             index = self.index(value)
 
             if index is not None:
-                del self._priority_queue[index]
-            else:
-                return
+                self.remove_at(index)
+            return
+
+        if quantity == -1:
+            kept = [index for index, item in enumerate(self._values) if item != value]
+        else:
+            # Drop the first matches in a single pass, rather than searching the queue again for each one. The front of
+            # the queue is at the end, so the pass runs backwards.
+            kept = []
+            for index in reversed(range(len(self._values))):
+                if quantity > 0 and self._values[index] == value:
+                    quantity -= 1
+                else:
+                    kept.append(index)
+            kept.reverse()
+
+        self._count_value(value, len(kept) - len(self._values))
+
+        self._priorities = array('d', (self._priorities[index] for index in kept))
+        self._values = [self._values[index] for index in kept]
 
     def remove_at(self, index: int) -> None:
         """Remove a value from the priority queue at a specified index.
@@ -498,7 +732,9 @@ class PriorityQueue:
             index (int):
                 The index of the value to remove from the priority queue.
         """
-        del self._priority_queue[index]
+        flipped_index = -index - 1
+        del self._priorities[flipped_index]
+        self._count_value(self._values.pop(flipped_index), -1)
 
     def index(self, value: Any, instance: int = 0) -> int | None:
         """Return the first index of a value in the priority queue.
@@ -514,10 +750,20 @@ class PriorityQueue:
             int: The index of the value.
             None: If the value is not in the priority queue or the instance is out of bounds.
         """
-        instances = [i for i, item in enumerate(self._priority_queue) if item["value"] == value]
+        if value not in self:
+            return None
+
+        # Counting from the front only needs to look as far as the requested instance.
+        instances = (i for i, item in enumerate(reversed(self._values)) if item == value)
+
+        if instance >= 0:
+            return next(itertools.islice(instances, instance, None), None)
+
+        instances = list(instances)
 
         # If the instance of the value is not in the queue, return None.
-        if instance >= len(instances) or abs(instance) > len(instances):
+        length = len(instances)
+        if not -length <= instance < length:
             return None
 
         return instances[instance]
@@ -537,7 +783,10 @@ class PriorityQueue:
         index = self.index(value, instance)
 
         if index is not None:
-            self._priority_queue[index]["priority"] = priority
+            flipped_index = -index - 1
+            del self._priorities[flipped_index]
+            del self._values[flipped_index]
+            self._insert(value, priority)
 
     def get_priority(self, value: Any, instance: int = 0) -> float | None:
         """Return the priority of a value in the priority queue.
@@ -556,7 +805,7 @@ class PriorityQueue:
         index = self.index(value, instance)
 
         if index is not None:
-            return self._priority_queue[index]["priority"]
+            return self._priorities[-index - 1]
 
         return None
 
@@ -568,10 +817,10 @@ class PriorityQueue:
             float: The highest priority in the priority queue.
             None: If the priority queue is empty.
         """
-        if not self._priority_queue:
+        if not self._priorities:
             return None
 
-        return self._priority_queue[0]["priority"]
+        return self._priorities[-1]
 
     @property
     def lowest_priority(self) -> float | None:
@@ -581,10 +830,10 @@ class PriorityQueue:
             float: The lowest priority in the priority queue.
             None: If the priority queue is empty.
         """
-        if not self._priority_queue:
+        if not self._priorities:
             return None
 
-        return self._priority_queue[-1]["priority"]
+        return self._priorities[0]
 
     @property
     def average_priority(self) -> float | None:
@@ -594,10 +843,10 @@ class PriorityQueue:
             float: The average priority in the priority queue.
             None: If the priority queue is empty.
         """
-        if not self._priority_queue:
+        if not self._priorities:
             return None
 
-        return sum(item["priority"] for item in self._priority_queue) / len(self._priority_queue)
+        return sum(self._priorities) / len(self._priorities)
 
     @property
     def median_priority(self) -> float | None:
@@ -607,48 +856,54 @@ class PriorityQueue:
             float: The median priority in the priority queue.
             None: If the priority queue is empty.
         """
-        if not self._priority_queue:
+        if not self._priorities:
             return None
 
-        sorted_queue = sorted(item["priority"] for item in self._priority_queue)
-        length = len(sorted_queue)
+        # The priorities are always kept sorted, so the median can be read straight from the middle.
+        length = len(self._priorities)
         half = length // 2
 
         if length % 2 == 0:
-            return (sorted_queue[half - 1] + sorted_queue[half]) / 2
+            return (self._priorities[half - 1] + self._priorities[half]) / 2
 
-        return sorted_queue[half]
+        return self._priorities[half]
 
     def __repr__(self) -> str:
-        return str(self._priority_queue[0]["value"] if self._priority_queue else None)
+        return str(self._values[-1] if self._values else None)
 
     def __bool__(self) -> bool:
-        return bool(self._priority_queue)
+        return bool(self._values)
 
     def __call__(self, value: Any = None, priority: float = 0) -> Any:
         if value is not None:
-            self._priority_queue.append({"value": value, "priority": priority})
+            self.add(value, priority)
             return None
 
         return self.pop()
 
     def __len__(self) -> int:
-        return len(self._priority_queue)
+        return len(self._values)
 
     def __iter__(self):
-        return iter(self._priority_queue)
+        return iter(self.queue)
 
     def __getitem__(self, index: int) -> Any:
-        return self._priority_queue[index]["value"]
+        return self._values[-index - 1]
 
     def __setitem__(self, index: int, value: Any) -> None:
-        self._priority_queue[index]["value"] = value
+        flipped_index = -index - 1
+        self._count_value(self._values[flipped_index], -1)
+        self._values[flipped_index] = value
+        self._count_value(value, 1)
 
     def __delitem__(self, index: int) -> None:
-        del self._priority_queue[index]
+        self.remove_at(index)
 
     def __contains__(self, value: Any) -> bool:
-        return any(item["value"] == value for item in self._priority_queue)
+        try:
+            return value in self._value_counts
+        except TypeError:
+            return value in self._values
 
 
 if __name__ == "__main__":
@@ -700,9 +955,7 @@ if __name__ == "__main__":
 
     # PriorityQueue
     print("\nPriorityQueue")
-    priority_queue = PriorityQueue([{"value": 1, "priority": 1}, {"value": 2, "priority": 2},
-                                   {"value": 3, "priority": 3}, {"value": 4, "priority": 4},
-                                   {"value": 5, "priority": 5}])
+    priority_queue = PriorityQueue([(1, 1), (2, 2), (3, 3), (4, 4), (5, 5)])
     print(priority_queue.queue)
     priority_queue.add(6, 6)
     print(priority_queue.queue)
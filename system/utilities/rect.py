@@ -1,4 +1,23 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, NamedTuple
+
+
 class Rect:
+    """An axis-aligned rectangle.
+
+    Attributes:
+        left (int):
+            The left of the rectangle.
+        top (int):
+            The top of the rectangle.
+        right (int):
+            The right of the rectangle.
+        bottom (int):
+            The bottom of the rectangle.
+    """
+
+    __slots__ = ('left', 'top', 'right', 'bottom')
 
     def __init__(self, left: int, top: int, right: int, bottom: int) -> None:
         """Initialize the Rect object.
@@ -51,26 +70,29 @@ class Rect:
         """
         return self.left <= x <= self.right and self.top <= y <= self.bottom
 
-    def intersect(self, other: "Rect") -> bool:
+    def intersect(self, other: "Rect | FrozenRect") -> bool:
         """Return whether the rectangles intersect.
 
         Args:
-            other (Rect):
+            other (Rect | FrozenRect):
                 The other rectangle.
 
         Returns:
             bool:
                 Whether the rectangles intersect.
+
+        Raises:
+            TypeError:
+                If the other object isn't a Rect or FrozenRect. Only checked when not running with -O.
         """
-        if not isinstance(other, Rect):
-            raise TypeError("The other object must be a Rect object.")
+        if __debug__:
+            if not isinstance(other, (Rect, FrozenRect)):
+                raise TypeError("The other object must be a Rect or FrozenRect object.")
 
-        if (self.left < other.right and
+        return (self.left < other.right and
                 self.right > other.left and
                 self.top < other.bottom and
-                self.bottom > other.top):
-            return True
-        return False
+                self.bottom > other.top)
 
     def move(self, dx: int, dy: int) -> None:
         """Move the rectangle.
@@ -96,59 +118,528 @@ class Rect:
         """Return the height of the rectangle."""
         return self.bottom - self.top
 
+    def translated(self, dx: int, dy: int) -> "Rect":
+        """Return a moved copy of the rectangle, leaving this one where it is.
+
+        Args:
+            dx (int):
+                The amount to move the copy in the x-direction.
+            dy (int):
+                The amount to move the copy in the y-direction.
+
+        Returns:
+            Rect:
+                The moved copy.
+        """
+        # Fill the slots directly rather than going through __init__.
+        rect = object.__new__(Rect)
+        rect.left = self.left + dx
+        rect.top = self.top + dy
+        rect.right = self.right + dx
+        rect.bottom = self.bottom + dy
+        return rect
+
+    def inflated(self, dx: int, dy: int) -> "Rect":
+        """Return a copy of the rectangle grown on every side. Negative amounts shrink it.
+
+        Args:
+            dx (int):
+                The amount to grow the left and right sides by.
+            dy (int):
+                The amount to grow the top and bottom sides by.
+
+        Returns:
+            Rect:
+                The grown rectangle.
+        """
+        return Rect(self.left - dx, self.top - dy, self.right + dx, self.bottom + dy)
+
     def copy(self) -> "Rect":
         """Return a copy of the rectangle."""
-        return Rect(self.left, self.top, self.right, self.bottom)
+        # Every slot is copied as-is, so skip the call to __init__.
+        rect = object.__new__(Rect)
+        rect.left = self.left
+        rect.top = self.top
+        rect.right = self.right
+        rect.bottom = self.bottom
+        return rect
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: dict) -> "Rect":
+        """Return a copy of the rectangle. The edges are ints, so a shallow copy is already a deep one."""
+        return self.copy()
+
+    def as_array(self) -> array:
+        """Return the rectangle's bounds as an array of (left, top, right, bottom).
+
+        Returns:
+            array:
+                The bounds as signed 64-bit integers.
+        """
+        return array('q', (self.left, self.top, self.right, self.bottom))
+
+    @classmethod
+    def from_array(cls, values: array) -> "Rect":
+        """Return a rectangle from the first four values of an array-like of (left, top, right, bottom).
+
+        Args:
+            values (array):
+                The bounds, such as from as_array.
+
+        Returns:
+            Rect:
+                The rectangle.
+        """
+        return cls(values[0], values[1], values[2], values[3])
+
+    def freeze(self) -> "FrozenRect":
+        """Return an immutable copy of the rectangle."""
+        return FrozenRect(self.left, self.top, self.right, self.bottom)
 
     def __str__(self) -> str:
         """Return the string representation of the object."""
-        return f"Rect({self.top}, {self.left}, {self.right}, {self.bottom})"
+        return f"Rect({self.left}, {self.top}, {self.right}, {self.bottom})"
 
     def __repr__(self) -> str:
         """Return the string representation of the object."""
         return self.__str__()
 
-    def __eq__(self, other: "Rect") -> bool:
+    def __eq__(self, other: object) -> bool:
         """Return whether the rectangles are equal.
 
         Args:
-            other (Rect):
+            other (object):
                 The other rectangle.
 
         Returns:
             bool:
                 Whether the rectangles are equal.
         """
-        return (self.left == other.left and
-                self.top == other.top and
-                self.right == other.right and
-                self.bottom == other.bottom)
+        if other.__class__ is not Rect:
+            return NotImplemented
+
+        return (self.left, self.top, self.right, self.bottom) == (other.left, other.top, other.right, other.bottom)
 
-    def __ne__(self, other: "Rect") -> bool:
-        """Return whether the rectangles are not equal.
+    def __hash__(self) -> int:
+        """Return the hash of the rectangle's bounds. Don't change a rectangle's bounds while it is in a set or dict."""
+        return hash((self.left, self.top, self.right, self.bottom))
+
+    def __contains__(self, other: "Rect | FrozenRect | Iterable[int]") -> bool:
+        """Return whether the rectangle contains the other rectangle, or the point, inclusive.
 
         Args:
-            other (Rect):
+            other (Rect | FrozenRect | Iterable[int]):
+                The other rectangle, or a point as an (x, y) pair such as a tuple or Point.
+
+        Returns:
+            bool:
+                Whether the rectangle contains the other rectangle or the point.
+        """
+        if isinstance(other, (Rect, FrozenRect)):
+            return (self.left <= other.left and
+                    self.top <= other.top and
+                    self.right >= other.right and
+                    self.bottom >= other.bottom)
+
+        x, y = other
+        return self.left <= x <= self.right and self.top <= y <= self.bottom
+
+
+class FrozenRect(NamedTuple):
+    """An immutable rectangle, for bounds that never change after they are made such as draw regions or dict keys. Being
+    a tuple, it hashes, compares and unpacks as (left, top, right, bottom) without any Python-level code.
+
+    Attributes:
+        left (int):
+            The left of the rectangle.
+        top (int):
+            The top of the rectangle.
+        right (int):
+            The right of the rectangle.
+        bottom (int):
+            The bottom of the rectangle.
+    """
+    left: int
+    top: int
+    right: int
+    bottom: int
+
+    def inside(self, x: int, y: int) -> bool:
+        """Return whether the point is inside the rectangle, inclusive.
+
+        Args:
+            x (int):
+                The x-coordinate of the point.
+            y (int):
+                The y-coordinate of the point.
+
+        Returns:
+            bool:
+                Whether the point is inside the rectangle.
+        """
+        left, top, right, bottom = self
+        return left <= x <= right and top <= y <= bottom
+
+    def intersect(self, other: "Rect | FrozenRect") -> bool:
+        """Return whether the rectangles intersect.
+
+        Args:
+            other (Rect | FrozenRect):
                 The other rectangle.
 
         Returns:
             bool:
-                Whether the rectangles are not equal.
+                Whether the rectangles intersect.
+        """
+        left, top, right, bottom = self
+        return left < other.right and right > other.left and top < other.bottom and bottom > other.top
+
+    @property
+    def width(self) -> int:
+        """Return the width of the rectangle."""
+        return self.right - self.left
+
+    @property
+    def height(self) -> int:
+        """Return the height of the rectangle."""
+        return self.bottom - self.top
+
+    def thaw(self) -> Rect:
+        """Return a mutable copy of the rectangle."""
+        return Rect(*self)
+
+
+class FatRect:
+    """A rectangle paired with a slightly larger "fat" copy of it, for keeping a moving rectangle in a RectIndex. The
+    fat rectangle is what goes in the index, and it only needs updating once the rectangle moves out of it, so small
+    movements cost nothing. Queries then return a few extra candidates, which can be checked against the exact
+    rectangle.
+
+    Attributes:
+        rect (Rect):
+            The exact rectangle. Move this one.
+        fat (Rect):
+            The grown rectangle to put in the index.
+        dx (int):
+            How much the fat rectangle is grown by on the left and right.
+        dy (int):
+            How much the fat rectangle is grown by on the top and bottom.
+    """
+
+    __slots__ = ('rect', 'fat', 'dx', 'dy')
+
+    def __init__(self, rect: Rect, dx: int = 1, dy: int = 1) -> None:
+        """Initialize the FatRect object.
+
+        Args:
+            rect (Rect):
+                The exact rectangle.
+            dx (int, optional):
+                How much to grow the fat rectangle by on the left and right.
+                Defaults to 1.
+            dy (int, optional):
+                How much to grow the fat rectangle by on the top and bottom.
+                Defaults to 1.
+        """
+        self.rect = rect
+        self.dx = dx
+        self.dy = dy
+        self.fat = rect.inflated(dx, dy)
+
+    def refresh(self) -> bool:
+        """Check whether the rectangle has left its fat rectangle since the last refresh and rebuild it if so. Call this
+        after moving the rectangle.
+
+        Returns:
+            bool:
+                True if the fat rectangle was rebuilt and so needs updating in the index, False otherwise.
         """
-        return not self.__eq__(other)
+        if self.rect in self.fat:
+            return False
 
-    def __contains__(self, other: "Rect") -> bool:
-        """Return whether the rectangle contains the other rectangle.
+        self.fat = self.rect.inflated(self.dx, self.dy)
+        return True
+
+
+class RectArray:
+    """Many rectangles stored as four packed columns of edges rather than as separate Rect objects, so a whole set of
+    rectangles can be tested against one rectangle in a single call.
+
+    Attributes:
+        lefts (array):
+            The left of each rectangle.
+        tops (array):
+            The top of each rectangle.
+        rights (array):
+            The right of each rectangle.
+        bottoms (array):
+            The bottom of each rectangle.
+    """
+
+    __slots__ = ('lefts', 'tops', 'rights', 'bottoms')
+
+    def __init__(self, size: int = 0) -> None:
+        """Initialize the RectArray object.
+
+        Args:
+            size (int, optional):
+                The number of rectangles to make room for. They all start as Rect(0, 0, 0, 0).
+                Defaults to 0.
+        """
+        self.lefts = array('q', bytes(8 * size))
+        self.tops = array('q', bytes(8 * size))
+        self.rights = array('q', bytes(8 * size))
+        self.bottoms = array('q', bytes(8 * size))
+
+    @classmethod
+    def from_rects(cls, rects: Iterable[Rect]) -> "RectArray":
+        """Return a RectArray holding the given rectangles.
+
+        Args:
+            rects (Iterable[Rect]):
+                The rectangles, in order.
+
+        Returns:
+            RectArray:
+                The rectangles as a RectArray.
+        """
+        rects = list(rects)
+        rect_array = cls()
+
+        # One pass per edge keeps each comprehension to a single attribute lookup.
+        rect_array.lefts.fromlist([rect.left for rect in rects])
+        rect_array.tops.fromlist([rect.top for rect in rects])
+        rect_array.rights.fromlist([rect.right for rect in rects])
+        rect_array.bottoms.fromlist([rect.bottom for rect in rects])
+
+        return rect_array
+
+    @classmethod
+    def from_array(cls, values: array) -> "RectArray":
+        """Return a RectArray from one flat array of bounds, four values per rectangle.
+
+        Args:
+            values (array):
+                The bounds as (left, top, right, bottom, left, top, ...), such as from as_array.
+
+        Returns:
+            RectArray:
+                The rectangles as a RectArray.
+
+        Raises:
+            ValueError:
+                If the number of values isn't a multiple of four.
+        """
+        values = array('q', values)
+
+        if len(values) % 4:
+            raise ValueError(f"Expected four values per rectangle, got {len(values)} values.")
+        rect_array = cls()
+
+        rect_array.lefts = values[0::4]
+        rect_array.tops = values[1::4]
+        rect_array.rights = values[2::4]
+        rect_array.bottoms = values[3::4]
+
+        return rect_array
+
+    def as_array(self) -> array:
+        """Return every rectangle's bounds in one flat array, four values per rectangle.
+
+        Returns:
+            array:
+                The bounds as (left, top, right, bottom, left, top, ...), in the same order as the rectangles.
+        """
+        values = array('q', bytes(32 * len(self.lefts)))
+
+        values[0::4] = self.lefts
+        values[1::4] = self.tops
+        values[2::4] = self.rights
+        values[3::4] = self.bottoms
+
+        return values
+
+    def append(self, rect: Rect) -> None:
+        """Add a rectangle to the end of the array.
+
+        Args:
+            rect (Rect):
+                The rectangle to add.
+        """
+        self.lefts.append(rect.left)
+        self.tops.append(rect.top)
+        self.rights.append(rect.right)
+        self.bottoms.append(rect.bottom)
+
+    def inside_all(self, x: int, y: int) -> list[bool]:
+        """Return whether the point is inside each rectangle, inclusive.
+
+        Args:
+            x (int):
+                The x-coordinate of the point.
+            y (int):
+                The y-coordinate of the point.
+
+        Returns:
+            list[bool]:
+                Whether the point is inside each rectangle, in order.
+        """
+        edges = zip(self.lefts, self.tops, self.rights, self.bottoms)
+
+        return [rect_left <= x <= rect_right and rect_top <= y <= rect_bottom
+                for rect_left, rect_top, rect_right, rect_bottom in edges]
+
+    def intersect_all(self, other: Rect) -> list[bool]:
+        """Return whether each rectangle intersects the other rectangle.
 
         Args:
             other (Rect):
                 The other rectangle.
 
         Returns:
-            bool:
-                Whether the rectangle contains the other rectangle.
+            list[bool]:
+                Whether each rectangle intersects the other rectangle, in order.
+        """
+        left, top, right, bottom = other.left, other.top, other.right, other.bottom
+        edges = zip(self.lefts, self.tops, self.rights, self.bottoms)
+
+        return [rect_left < right and rect_right > left and rect_top < bottom and rect_bottom > top
+                for rect_left, rect_top, rect_right, rect_bottom in edges]
+
+    def contains_all(self, other: Rect) -> list[bool]:
+        """Return whether each rectangle contains the other rectangle.
+
+        Args:
+            other (Rect):
+                The other rectangle.
+
+        Returns:
+            list[bool]:
+                Whether each rectangle contains the other rectangle, in order.
+        """
+        left, top, right, bottom = other.left, other.top, other.right, other.bottom
+        edges = zip(self.lefts, self.tops, self.rights, self.bottoms)
+
+        return [rect_left <= left and rect_top <= top and rect_right >= right and rect_bottom >= bottom
+                for rect_left, rect_top, rect_right, rect_bottom in edges]
+
+    def __len__(self) -> int:
+        return len(self.lefts)
+
+    def __getitem__(self, index: int) -> Rect:
+        return Rect(self.lefts[index], self.tops[index], self.rights[index], self.bottoms[index])
+
+
+class RectIndex:
+    """A set of rectangles that can be searched for the ones overlapping a region without testing every one of them.
+
+    The rectangles are kept sorted by their left edge. A query only looks at the ones whose left edge could still let
+    them overlap the region, which is found by binary search using the widest rectangle in the set.
+
+    Attributes:
+        rects (RectArray):
+            The rectangles, in the order they were added. Indices returned by query refer to this.
+    """
+
+    __slots__ = ('rects', '_lefts', '_order', '_max_width')
+
+    def __init__(self, rects: Iterable[Rect] = ()) -> None:
+        """Initialize the RectIndex object.
+
+        Args:
+            rects (Iterable[Rect], optional):
+                The rectangles to start with.
+                Defaults to ().
+        """
+        self.rects = RectArray.from_rects(rects)
+
+        lefts = self.rects.lefts
+
+        self._order = sorted(range(len(lefts)), key=lefts.__getitem__)
+        self._lefts = [lefts[index] for index in self._order]
+        self._max_width = max((right - left for left, right in zip(lefts, self.rects.rights)), default=0)
+
+    def add(self, rect: Rect) -> int:
+        """Add a rectangle to the index.
+
+        Args:
+            rect (Rect):
+                The rectangle to add.
+
+        Returns:
+            int:
+                The index of the new rectangle.
         """
-        return (self.left <= other.left and
-                self.top <= other.top and
-                self.right >= other.right and
-                self.bottom >= other.bottom)
+        index = len(self.rects)
+        self.rects.append(rect)
+
+        self._insert(index, rect)
+
+        return index
+
+    def update(self, index: int, rect: Rect) -> None:
+        """Replace a rectangle with new bounds, such as after it has moved.
+
+        Args:
+            index (int):
+                The index of the rectangle to replace.
+            rect (Rect):
+                The new bounds.
+        """
+        rects = self.rects
+
+        # Find this index among any rectangles sharing its old left edge.
+        position = self._order.index(index, bisect_left(self._lefts, rects.lefts[index]))
+        del self._order[position]
+        del self._lefts[position]
+
+        rects.lefts[index] = rect.left
+        rects.tops[index] = rect.top
+        rects.rights[index] = rect.right
+        rects.bottoms[index] = rect.bottom
+
+        self._insert(index, rect)
+
+    def query(self, rect: Rect) -> list[int]:
+        """Return the indices of the rectangles that intersect the given rectangle.
+
+        Args:
+            rect (Rect):
+                The region to search.
+
+        Returns:
+            list[int]:
+                The indices of the intersecting rectangles, ordered by their left edge.
+        """
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+
+        # Nothing left of this can reach past the region's left edge, and nothing from the region's right edge on can
+        # start before it ends.
+        start = bisect_right(self._lefts, left - self._max_width)
+        end = bisect_left(self._lefts, right)
+
+        tops, rights, bottoms = self.rects.tops, self.rects.rights, self.rects.bottoms
+
+        return [index for index in self._order[start:end]
+                if rights[index] > left and tops[index] < bottom and bottoms[index] > top]
+
+    def _insert(self, index: int, rect: Rect) -> None:
+        """Put an index into the sorted order by the rectangle's left edge.
+
+        Args:
+            index (int):
+                The index of the rectangle.
+            rect (Rect):
+                The rectangle at that index.
+        """
+        position = bisect_right(self._lefts, rect.left)
+        self._lefts.insert(position, rect.left)
+        self._order.insert(position, index)
+
+        # The widest rectangle is only ever grown, so the search window stays wide enough after updates.
+        if rect.right - rect.left > self._max_width:
+            self._max_width = rect.right - rect.left
+
+    def __len__(self) -> int:
+        return len(self.rects)